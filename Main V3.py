@@ -1,35 +1,127 @@
+import asyncio
+import collections
+import hashlib
+import io
 import os
+import re
 import sys
 import threading
 import time
 import wave
 import logging
+import mmap
+import struct
 import queue
 import json
 import shutil
+import socket
 import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from tkinter import ttk, filedialog, messagebox, scrolledtext, simpledialog
 
 import sounddevice as sd
 import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import pygame
 import yaml
 import keyring
-from pydub import AudioSegment
-from docx import Document
-from fpdf import FPDF
 import pyperclip
-import pystray
-from PIL import Image, ImageDraw
 import tkinterdnd2
 import tempfile
 
 from pynput import keyboard
 
+try:
+    from yaml import CSafeLoader as YamlLoader, CSafeDumper as YamlDumper  # LibYAML bindings
+except ImportError:
+    from yaml import SafeLoader as YamlLoader, SafeDumper as YamlDumper
+
+try:
+    import orjson  # Optional: much faster JSON parsing for large transcription histories
+except ImportError:
+    orjson = None
+
 # Initialize basic logging for debugging and application behavior tracking
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+# Audio file types accepted by drag-and-drop
+AUDIO_EXTENSIONS = frozenset({'.wav', '.mp3', '.ogg', '.flac'})
+
+# Markup in help_text.txt: anything from '<' to the next '>' is a tag
+FORMATTED_TAG_RE = re.compile(r'<([^>]*)>')
+# Untagged text emitted for structural tags
+FORMATTED_BLOCK_TEXT = {
+    'table': '\n', '/table': '\n', 'tr': '\n', '/tr': '\n',
+    'th': '\n', '/th': '\n', 'td': '\n', '/td': '\n',
+    'li': '• ', '/li': '\n',
+    'summary': '\n', '/summary': '\n', 'details': '\n', '/details': '\n',
+}
+
+class AudioRingBuffer:
+    """
+    Preallocated single-producer/single-consumer ring of audio frames.
+    The audio callback copies blocks in with write(); the WAV writer takes contiguous views with read().
+    """
+
+    __slots__ = ('buffer', 'capacity', 'write_pos', 'read_pos', 'dropped_frames', 'closed', 'data_ready')
+
+    def __init__(self, frames, channels, dtype):
+        self.buffer = np.empty((frames, channels), dtype=dtype)
+        self.capacity = frames
+        self.write_pos = 0  # Total frames written, only advanced by the producer
+        self.read_pos = 0   # Total frames consumed, only advanced by the consumer
+        self.dropped_frames = 0
+        self.closed = False
+        self.data_ready = threading.Event()
+
+    def write(self, block):
+        """
+        Copies a block of frames into the ring. Drops the block and returns False if the ring is full.
+        """
+        frames = len(block)
+        if self.write_pos - self.read_pos + frames > self.capacity:
+            self.dropped_frames += frames
+            return False
+        start = self.write_pos % self.capacity
+        first = min(frames, self.capacity - start)
+        self.buffer[start:start + first] = block[:first]
+        if first < frames:
+            self.buffer[:frames - first] = block[first:]
+        self.write_pos += frames
+        self.data_ready.set()
+        return True
+
+    def close(self):
+        """
+        Marks the end of the stream; read() returns None once the remaining frames are consumed.
+        """
+        self.closed = True
+        self.data_ready.set()
+
+    def read(self):
+        """
+        Waits for unread frames and returns a contiguous view of them (up to the end of the ring),
+        or None when the ring is closed and empty. Call consume() once the view has been used.
+        """
+        while True:
+            self.data_ready.clear()
+            available = self.write_pos - self.read_pos
+            if available:
+                start = self.read_pos % self.capacity
+                return self.buffer[start:start + min(available, self.capacity - start)]
+            if self.closed:
+                return None
+            self.data_ready.wait()
+
+    def consume(self, frames):
+        """
+        Releases frames returned by read() so the producer can reuse the space.
+        """
+        self.read_pos += frames
+
+
 class AudioTranscriberApp:
     """
     AudioTranscriberApp encapsulates the functionalities of the Audio Recorder and Transcriber application.
@@ -40,30 +132,103 @@ class AudioTranscriberApp:
         self.root = root
         self.root.title("Audio Recorder and Transcriber")
 
+        # Install and bundled-resource locations, resolved on first use
+        self.executable_dir = None
+        self.resource_paths = {}
+
         # Initialize pygame for playing sounds
         pygame.mixer.init()
         
         # Initialize reading state
         self.reading_cancelled = False
+        self.reading_cancel_event = None
+
+        # Recently synthesized TTS clips, keyed by a hash of the chunk text, bounded by their total size
+        self.tts_cache = collections.OrderedDict()
+        self.tts_cache_bytes = 0
+        self.tts_cache_max_bytes = 64 * 1024 * 1024
+
+        # Event loop for OpenAI API calls, started on first use, and the client that runs on it
+        self.async_loop = None
+        self.openai_client = None
+
+        # API key as last read from or written to the keyring (None until first lookup)
+        self._api_key_cache = None
+        self.API_KEY = None
 
         # Initialize configuration
         self.config = self.load_config()
         self.settings = self.config['settings']
+        self._profile_names = None
+        # Playback volume last applied to the mixer
+        self.volume = self.settings.get("volume", 1.0)
 
-        # Initialize tray icon
-        self.initialize_tray_icon()
+        # Tray icon, created shortly after startup so the main window paints first
+        self.tray_icon = None
+        self.root.after(200, self.initialize_tray_icon)
 
         # Initialize other attributes
         self.FORMAT = 'int16'
+        self.CHANNELS = 2
+        self.RATE = int(self.settings.get('sample_rate', 44100))
         self.CHUNK = 1024
         self.recording = False
         self.cancel_recording = False
         self.cancel_transcription = False
         self.WAVE_OUTPUT_FILENAME = "output.wav"
         self.transcription_queue = queue.Queue()
+        self.pending_status = None
+        self.status_flush_scheduled = False
+        # Dialogs are built on first open and hidden, not destroyed, when closed
+        self.settings_window = None
+        self.refresh_settings_window = None
+        self.help_window = None
+        self.help_text = None
+        self.help_mtime = None
+        # Shared HTTP session so API calls reuse keep-alive connections
+        self.http = requests.Session()
+        self.http.mount('https://', HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=8,
+            # API calls are billed POSTs, so only retry when the request cannot have been processed:
+            # failed connects and 429/503 rejections. Read timeouts and other 5xx are not retried.
+            max_retries=Retry(
+                total=3,
+                read=0,
+                backoff_factor=0.5,
+                status_forcelist=[429, 503],
+                allowed_methods=frozenset({'GET', 'POST'}),
+                raise_on_status=False
+            )
+        ))
+        # The key can change at runtime, so attach it per request
+        self.http.auth = self._bearer_auth
         self.transcription_history = []
+        # Lowercased copy of transcription_history kept in step with it for searching
+        self.history_lower = []
+        # Listbox text for each entry, truncated once when the entry is added
+        self.history_display = []
+        self.search_job = None
+        # History formatted for GPT prompts; extended as entries are appended, reset on removals.
+        # GPT requests run on worker threads, so the list is only touched under the lock
+        self.history_prompt_parts = []
+        self.history_prompt_lock = threading.Lock()
         self.history_file = os.path.join(self.get_executable_dir(), 'transcription_history.json')
         self.backup_history_file = os.path.join(self.get_executable_dir(), 'transcription_history_backup.json')
+        # New entries are appended to a journal and folded into history_file periodically
+        self.history_journal_file = os.path.join(self.get_executable_dir(), 'transcription_history.jsonl')
+        self.history_journal = None
+        # Digest of the history file the journal's lines build on; lines journaled against an
+        # earlier file are stale even if their index happens to match the current one
+        self.history_base = self.history_digest(b"")
+        self.unsaved_history_count = 0
+        # Set when entries were removed, which the append-only journal can't record
+        self.history_dirty = False
+        # All history file writes run in submission order on one background thread
+        self.history_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="history-writer")
+        # Failures from the writer thread, reported by the UI thread; the writer never calls into Tk
+        self.history_errors = queue.Queue()
+        self.history_save_job = None
 
         # Initialize paused attribute
         self.paused = False
@@ -72,8 +237,8 @@ class AudioTranscriberApp:
         self.create_ui()
         self.bind_events()
 
-        # Perform system check
-        self.system_check()
+        # Perform system check once the window is up
+        self.root.after(500, self.system_check)
 
         # Start authentication and API key setup
         self.authenticate_and_initialize()
@@ -99,8 +264,8 @@ class AudioTranscriberApp:
 
     def load_and_verify_api_key(self):
         """
-        Retrieves the API key from keyring or environment variables. If not found, prompts the user to enter it.
-        Returns True if API key is successfully retrieved, False otherwise.
+        Uses the API key from environment variables, or the one load_config found in the keyring or config file.
+        If neither is set, prompts the user to enter it. Returns True if API key is successfully retrieved, False otherwise.
         """
         # First try to get from environment variables
         api_key = os.environ.get("OPENAI_API_KEY")
@@ -110,15 +275,38 @@ class AudioTranscriberApp:
             self.API_KEY = api_key
             return True
             
-        # Then try keyring
-        api_key = keyring.get_password("whisper_api", "api_key")
-        if not api_key:
-            logging.info("API key not found. Prompting user to enter it.")
-            return self.prompt_for_api_key()
-        else:
-            self.API_KEY = api_key
+        # load_config has already looked in the keyring and config file
+        if self.API_KEY:
             return True
 
+        logging.info("API key not found. Prompting user to enter it.")
+        return self.prompt_for_api_key()
+
+    def _bearer_auth(self, request):
+        """
+        Adds the current API key to an outgoing request on the shared HTTP session.
+        """
+        request.headers["Authorization"] = f"Bearer {self.API_KEY}"
+        return request
+
+    def _get_keyring_api_key(self):
+        """
+        Returns the API key stored in the keyring, querying the keyring only once per session.
+        """
+        if self._api_key_cache is None:
+            self._api_key_cache = keyring.get_password("whisper_api", "api_key") or ""
+        return self._api_key_cache or None
+
+    def _set_keyring_api_key(self, api_key):
+        """
+        Stores the API key in the keyring and updates the cached copy.
+        Does nothing if the keyring already holds this key.
+        """
+        if api_key == self._api_key_cache:
+            return
+        keyring.set_password("whisper_api", "api_key", api_key)
+        self._api_key_cache = api_key
+
     def prompt_for_api_key(self):
         """
         Prompts the user to enter their OpenAI API key and stores it securely.
@@ -127,8 +315,9 @@ class AudioTranscriberApp:
         while True:
             api_key = simpledialog.askstring("API Key", "Enter your OpenAI API key for transcription:", show='*')
             if api_key:
-                keyring.set_password("whisper_api", "api_key", api_key)
+                self._set_keyring_api_key(api_key)
                 self.API_KEY = api_key
+                self.settings["api_key"] = api_key
                 logging.info("API key saved securely in keyring.")
                 return True
             else:
@@ -162,73 +351,182 @@ class AudioTranscriberApp:
         self.cancel_button.config(state='normal', text="Cancel Reading", command=self.cancel_reading)
         self.reading_cancelled = False
 
-        # Start the reading in a separate thread
-        self.read_thread = threading.Thread(target=self._read_aloud_thread, args=(text,), daemon=True)
-        self.read_thread.start()
+        # Run the reading on the shared event loop
+        self.read_future = asyncio.run_coroutine_threadsafe(self._read_aloud_async(text), self.get_async_loop())
 
-    def _read_aloud_thread(self, text):
+    def get_async_loop(self):
+        """
+        Returns the background asyncio event loop used for OpenAI API calls, starting it if needed.
         """
-        Thread function that handles the actual text-to-speech conversion and playback.
+        if self.async_loop is None:
+            self.async_loop = asyncio.new_event_loop()
+            threading.Thread(target=self.async_loop.run_forever, daemon=True).start()
+        return self.async_loop
+
+    async def _read_aloud_async(self, text):
         """
+        Coroutine that handles the actual text-to-speech conversion and playback.
+        Long text is split into sentence chunks that are synthesized concurrently and
+        queued on the mixer channel, so playback starts after the first chunk is ready.
+        """
+        self.reading_cancel_event = asyncio.Event()
+        tasks = []
+        status = ("Reading cancelled", "warning")
         try:
-            from openai import OpenAI
-            client = OpenAI(api_key=self.API_KEY)
-            
-            # Determine file path
-            timestamp = int(time.time())
-            if self.save_audio_var.get():
+            client = await self._get_openai_client()
+            semaphore = asyncio.Semaphore(3)
+
+            async def synthesize(chunk_text):
+                # Reuse the decoded clip if this chunk was read recently
+                cache_key = hashlib.blake2b(chunk_text.encode('utf-8'), digest_size=16).digest()
+                cached = self.tts_cache.get(cache_key)
+                if cached is not None:
+                    self.tts_cache.move_to_end(cache_key)
+                    return cached[0]
+
+                async with semaphore:
+                    # Stream the synthesized speech straight into memory
+                    audio_buffer = io.BytesIO()
+                    async with client.audio.speech.with_streaming_response.create(
+                        model="tts-1",
+                        voice="alloy",
+                        input=chunk_text
+                    ) as response:
+                        async for chunk in response.iter_bytes(4096):
+                            audio_buffer.write(chunk)
+
+                audio_bytes = audio_buffer.getvalue()
+                audio_buffer.seek(0)
+                sound = pygame.mixer.Sound(file=audio_buffer)
+                clip = (audio_bytes, sound)
+                # A decoded Sound holds raw PCM, far larger than the MP3 it came from
+                freq, size, channels = pygame.mixer.get_init()
+                clip_bytes = len(audio_bytes) + int(sound.get_length() * freq * channels * abs(size) // 8)
+                if cache_key not in self.tts_cache:
+                    self.tts_cache[cache_key] = (clip, clip_bytes)
+                    self.tts_cache_bytes += clip_bytes
+                while self.tts_cache_bytes > self.tts_cache_max_bytes and len(self.tts_cache) > 1:
+                    _, evicted_bytes = self.tts_cache.popitem(last=False)[1]
+                    self.tts_cache_bytes -= evicted_bytes
+                return clip
+
+            tasks = [asyncio.create_task(synthesize(chunk_text)) for chunk_text in self._split_tts_text(text)]
+            audio_parts = []
+            channel = pygame.mixer.Channel(1)
+            try:
+                # Monotonic time at which everything handed to the mixer has finished playing
+                playback_end = time.monotonic()
+                for task in tasks:
+                    if self.reading_cancelled:
+                        break
+                    audio_bytes, sound = await task
+                    audio_parts.append(audio_bytes)
+                    if self.reading_cancelled:
+                        break
+
+                    if channel.get_busy():
+                        # Wait for the queue slot to free up, then queue behind the playing clip
+                        while channel.get_queue() is not None and not await self._wait_reading_cancelled(0.05):
+                            pass
+                        if self.reading_cancelled:
+                            break
+                        channel.queue(sound)
+                        clip_start = max(playback_end, time.monotonic())
+                    else:
+                        channel.play(sound)
+                        clip_start = time.monotonic()
+
+                    # Sleep until the queued clip starts playing; cancel_reading() wakes us early
+                    await self._wait_reading_cancelled(clip_start - time.monotonic())
+                    playback_end = clip_start + sound.get_length()
+
+                # Sleep until playback should be over, then cover any mixer lag
+                if not self.reading_cancelled:
+                    await self._wait_reading_cancelled(playback_end - time.monotonic())
+                while channel.get_busy() and not await self._wait_reading_cancelled(0.1):
+                    pass
+
+            finally:
+                # Clean up the channel
+                channel.stop()
+
+            # Only touch the disk if the user asked for the audio to be saved
+            if self.save_audio_var.get() and audio_parts:
                 # Create an 'audio_output' directory if it doesn't exist
                 output_dir = os.path.join(self.get_executable_dir(), 'audio_output')
                 os.makedirs(output_dir, exist_ok=True)
-                audio_path = os.path.join(output_dir, f'tts_audio_{timestamp}.mp3')
+                # NamedTemporaryFile gives a unique name even for two reads within the same second
+                with tempfile.NamedTemporaryFile(
+                    dir=output_dir, prefix=f'tts_audio_{int(time.time())}_', suffix='.mp3', delete=False
+                ) as audio_file:
+                    audio_file.write(b''.join(audio_parts))
+                audio_path = audio_file.name
+                saved_note = f" Audio saved to: {audio_path}"
             else:
-                temp_dir = tempfile.gettempdir()
-                audio_path = os.path.join(temp_dir, f'tts_audio_{timestamp}.mp3')
-            
-            # Call OpenAI TTS API
-            response = client.audio.speech.create(
-                model="tts-1",
-                voice="alloy",
-                input=text
-            )
-            
-            # Write the response content to file
-            response.write_to_file(audio_path)
-            
-            if not self.reading_cancelled:
-                try:
-                    # Create a separate mixer channel for TTS playback
-                    pygame.mixer.Channel(1).play(pygame.mixer.Sound(audio_path))
-                    
-                    # Wait for playback to finish or cancellation
-                    while pygame.mixer.Channel(1).get_busy() and not self.reading_cancelled:
-                        pygame.time.Clock().tick(10)
-                        
-                finally:
-                    # Clean up the channel
-                    pygame.mixer.Channel(1).stop()
-            
-            # Only remove the file if it's not meant to be saved
-            if not self.save_audio_var.get():
-                try:
-                    os.remove(audio_path)
-                except Exception as e:
-                    logging.warning(f"Could not remove temporary file {audio_path}: {e}")
-            else:
-                self.root.after(0, lambda: self.update_status(f"Audio saved to: {audio_path}", "info"))
-            
+                saved_note = ""
+
             if not self.reading_cancelled:
-                self.root.after(0, lambda: self.update_status("Reading text aloud completed", "info"))
+                status = (f"Reading text aloud completed.{saved_note}", "info")
             else:
-                self.root.after(0, lambda: self.update_status("Reading cancelled", "warning"))
+                status = (f"Reading cancelled.{saved_note}", "warning")
             
         except Exception as e:
             logging.error(f"Error reading text aloud: {e}")
-            error_msg = str(e)  # Capture the error message
-            self.root.after(0, lambda: self.update_status(f"Error reading text: {error_msg}", "error"))
+            status = (f"Error reading text: {e}", "error")
         finally:
-            # Re-enable the read aloud button and reset cancel button
-            self.root.after(0, self._reset_read_aloud_buttons)
+            # Drop any synthesis still in flight
+            for task in tasks:
+                task.cancel()
+            self.reading_cancel_event = None
+            # Apply the final status and button state in one idle callback
+            self.root.after_idle(self._finalize_read_aloud, *status)
+
+    async def _get_openai_client(self):
+        """
+        Returns the shared AsyncOpenAI client, replacing it if the API key has changed since it was created.
+        Must be awaited on the background event loop.
+        """
+        from openai import AsyncOpenAI
+
+        if self.openai_client is not None and self.openai_client.api_key != self.API_KEY:
+            await self.openai_client.close()
+            self.openai_client = None
+        if self.openai_client is None:
+            self.openai_client = AsyncOpenAI(api_key=self.API_KEY)
+        return self.openai_client
+
+    async def _wait_reading_cancelled(self, timeout):
+        """
+        Waits up to timeout seconds for reading to be cancelled. Returns True if it was.
+        """
+        try:
+            await asyncio.wait_for(self.reading_cancel_event.wait(), timeout=max(0.0, timeout))
+        except asyncio.TimeoutError:
+            pass
+        return self.reading_cancel_event.is_set()
+
+    def _split_tts_text(self, text, max_chars=400):
+        """
+        Splits text into sentence-aligned chunks of roughly max_chars characters for pipelined TTS.
+        """
+        chunks = []
+        current = ""
+        for sentence in re.split(r'(?<=[.!?])\s+', text):
+            if current and len(current) + len(sentence) + 1 > max_chars:
+                chunks.append(current)
+                current = sentence
+            else:
+                current = f"{current} {sentence}" if current else sentence
+        if current:
+            chunks.append(current)
+        return chunks
+
+    def _finalize_read_aloud(self, message, status_type):
+        """
+        Shows the final read aloud status and resets the buttons.
+        """
+        self.update_status(message, status_type)
+        self._reset_read_aloud_buttons()
 
     def _reset_read_aloud_buttons(self):
         """
@@ -246,6 +544,9 @@ class AudioTranscriberApp:
         Cancels the current text-to-speech playback.
         """
         self.reading_cancelled = True
+        cancel_event = self.reading_cancel_event
+        if cancel_event is not None:
+            self.async_loop.call_soon_threadsafe(cancel_event.set)
         pygame.mixer.Channel(1).stop()
         
 
@@ -265,7 +566,9 @@ class AudioTranscriberApp:
                 "transcription_model": "whisper-1",
                 "volume": 1.0,
                 "profiles": {},
-                "gpt_model": "chatgpt-4o-latest"
+                "gpt_model": "chatgpt-4o-latest",
+                "parallel_chunks": 4,
+                "tray_icon": True
             }
         }
 
@@ -276,7 +579,7 @@ class AudioTranscriberApp:
         if not os.path.exists(config_path):
             try:
                 with open(config_path, 'w') as file:
-                    yaml.dump(default_config, file)
+                    yaml.dump(default_config, file, Dumper=YamlDumper)
                 logging.info(f"Created new config file at {config_path}")
             except PermissionError:
                 logging.warning(f"Unable to create config file at {config_path}. Using default settings.")
@@ -285,7 +588,7 @@ class AudioTranscriberApp:
         try:
             # Load the existing config file
             with open(config_path, 'r') as file:
-                config = yaml.safe_load(file)
+                config = yaml.load(file, Loader=YamlLoader) or {}
                 
                 # Merge loaded config with default config to ensure all keys exist
                 config = {**default_config, **config}
@@ -295,19 +598,18 @@ class AudioTranscriberApp:
                 config["settings"]["sample_rate"] = int(config["settings"].get("sample_rate", 44100))
                 
                 # Attempt to retrieve API key from keyring
-                api_key = keyring.get_password("whisper_api", "api_key")
+                api_key = self._get_keyring_api_key()
                 
                 # If API key not in keyring, check config file
                 if not api_key:
                     api_key = config["settings"].get("api_key")
                     if api_key:
                         # If found in config, save to keyring for future use
-                        keyring.set_password("whisper_api", "api_key", api_key)
+                        self._set_keyring_api_key(api_key)
                         logging.info("API key found in config file and saved to keyring.")
                     else:
-                        # If not found anywhere, prompt user to enter it
-                        logging.warning("API key not found in keyring or config file. Prompting user to enter it.")
-                        self.prompt_for_api_key()
+                        # Prompting is left to authenticate_and_initialize so it only happens once
+                        logging.warning("API key not found in keyring or config file.")
                 
                 # Set the API key in the config and class attribute
                 config["settings"]["api_key"] = api_key
@@ -324,42 +626,51 @@ class AudioTranscriberApp:
         """
         Saves the current settings to config.yaml. Excludes the API key to ensure it remains secure.
         """
-        config_path = os.path.join(self.get_executable_dir(), 'config.yaml')
         try:
-            # Exclude API key and auth key from being saved in config.yaml
-            settings_to_save = self.settings.copy()
-            settings_to_save.pop("api_key", None)
-            settings_to_save.pop("auth_key", None)
-            with open(config_path, 'w') as file:
-                yaml.dump({"settings": settings_to_save}, file)
-            logging.info(f"Configuration saved successfully to {config_path}")
+            self.write_config(self.settings.copy())
         except Exception as e:
             logging.error(f"Error while saving configuration: {e}")
             messagebox.showerror("Error", f"Failed to save configuration: {e}")
 
+    def write_config(self, settings_to_save):
+        """
+        Writes a copy of the settings to config.yaml, raising on failure. Safe to call off the UI thread.
+        """
+        config_path = os.path.join(self.get_executable_dir(), 'config.yaml')
+        # Exclude API key and auth key from being saved in config.yaml
+        settings_to_save.pop("api_key", None)
+        settings_to_save.pop("auth_key", None)
+        with open(config_path, 'w') as file:
+            yaml.dump({"settings": settings_to_save}, file, Dumper=YamlDumper)
+        logging.info(f"Configuration saved successfully to {config_path}")
+
 
     def get_executable_dir(self):
         """
         Get the directory of the executable or script.
         """
-        if getattr(sys, 'frozen', False):
-            # Running as compiled executable
-            return os.path.dirname(sys.executable)
-        else:
-            # Running as script
-            return os.path.dirname(os.path.abspath(__file__))
+        if self.executable_dir is None:
+            if getattr(sys, 'frozen', False):
+                # Running as compiled executable
+                self.executable_dir = os.path.dirname(sys.executable)
+            else:
+                # Running as script
+                self.executable_dir = os.path.dirname(os.path.abspath(__file__))
+        return self.executable_dir
 
     def resource_path(self, relative_path):
         """
         Get absolute path to resource, works for dev and for PyInstaller.
         """
-        try:
-            # PyInstaller creates a temp folder and stores path in _MEIPASS
-            base_path = sys._MEIPASS
-        except Exception:
-            base_path = os.path.abspath(".")
-
-        return os.path.join(base_path, relative_path)
+        path = self.resource_paths.get(relative_path)
+        if path is None:
+            try:
+                # PyInstaller creates a temp folder and stores path in _MEIPASS
+                base_path = sys._MEIPASS
+            except Exception:
+                base_path = os.path.abspath(".")
+            path = self.resource_paths[relative_path] = os.path.join(base_path, relative_path)
+        return path
 
     def create_ui(self):
         """
@@ -375,6 +686,7 @@ class AudioTranscriberApp:
         file_menu.add_command(label="Export", command=self.export_transcription)
         file_menu.add_command(label="Settings", command=self.open_settings)
         file_menu.add_command(label="Load Previous Transcriptions", command=self.load_previous_transcriptions)
+        file_menu.add_command(label="Bulk Transcribe", command=self.bulk_transcribe_files)
         file_menu.add_command(label="Help", command=self.open_help)
         file_menu.add_separator()
         file_menu.add_command(label="Exit", command=self.on_closing)
@@ -412,52 +724,41 @@ class AudioTranscriberApp:
     def define_styles(self):
         """
         Defines custom styles for various widgets to ensure a consistent and modern UI appearance.
-        """
-        # Define button styles
-        self.style.configure("Cancel.TButton", padding=10, relief="flat", background="#f44336", foreground="white")
-        self.style.map("Cancel.TButton",
-                       background=[('active', '#FFA500'), ('!active', 'grey')],
-                       foreground=[('!active', 'white')])
-
-        self.style.configure("Record.TButton", padding=10, relief="flat", background="#4CAF50", foreground="white")
-        self.style.map("Record.TButton", background=[('active', '#45a049')])
-
-        self.style.configure("Stop.TButton", padding=10, relief="flat", background="#f44336", foreground="white")
-        self.style.map("Stop.TButton", background=[('active', '#e53935')])
-
-        self.style.configure("Upload.TButton", padding=10, relief="flat", background="#8A2BE2", foreground="white")
-        self.style.map("Upload.TButton", background=[('active', '#7B68EE')])
-
-        self.style.configure("Clear.TButton", padding=10, relief="flat", background="#FF0000", foreground="white")
-        self.style.map("Clear.TButton", background=[('active', '#CC0000')])  # Darker red on hover
-
-        self.style.configure("ClearAll.TButton", padding=10, relief="flat", background="#FF4500", foreground="white")
-        self.style.map("ClearAll.TButton", background=[('active', '#FF6347')])
-
-        self.style.configure("Export.TButton", padding=10, relief="flat", background="#2196F3", foreground="white")
-        self.style.map("Export.TButton", background=[('active', '#1976D2')])
-
-        self.style.configure("Toggle.TButton", padding=10, relief="flat", background="#555555", foreground="white")
-        self.style.map("Toggle.TButton", background=[('active', '#777777')])
-
-        self.style.configure("Copy.TButton", padding=10, relief="flat", background="#4CAF50", foreground="white")
-        self.style.map("Copy.TButton", background=[('active', '#45a049')])
+        All styles are sent to Tcl as one script, instead of one round-trip per configure/map call.
+        """
+        # Flat button styles: (style name, background, background while active)
+        button_styles = [
+            ("Cancel.TButton", "#f44336", None),
+            ("Record.TButton", "#4CAF50", "#45a049"),
+            ("Stop.TButton", "#f44336", "#e53935"),
+            ("Upload.TButton", "#8A2BE2", "#7B68EE"),
+            ("Clear.TButton", "#FF0000", "#CC0000"),  # Darker red on hover
+            ("ClearAll.TButton", "#FF4500", "#FF6347"),
+            ("Export.TButton", "#2196F3", "#1976D2"),
+            ("Toggle.TButton", "#555555", "#777777"),
+            ("Copy.TButton", "#4CAF50", "#45a049"),
+            # Button styles for profile page
+            ("Save.TButton", "#4CAF50", "#45a049"),
+            ("Delete.TButton", "#f44336", "#d32f2f"),
+            # ReadAloud button style
+            ("ReadAloud.TButton", "#2196F3", "#1976D2"),
+        ]
+
+        script = []
+        for name, background, active_background in button_styles:
+            script.append(f"ttk::style configure {name} -padding 10 -relief flat -background {background} -foreground white")
+            if active_background:
+                script.append(f"ttk::style map {name} -background {{active {active_background}}}")
+
+        # The cancel button greys out whenever it isn't hovered
+        script.append("ttk::style map Cancel.TButton -background {active #FFA500 !active grey} -foreground {!active white}")
 
         # Define label and frame styles
-        self.style.configure("TLabel", padding=6, background="#f0f0f0")
-        self.style.configure("TFrame", background="#f0f0f0")
-        self.style.configure("TText", background="#ffffff", foreground="#000000")
-
-        # Define button styles for profile page
-        self.style.configure("Save.TButton", padding=10, relief="flat", background="#4CAF50", foreground="white")
-        self.style.map("Save.TButton", background=[('active', '#45a049')])
+        script.append("ttk::style configure TLabel -padding 6 -background #f0f0f0")
+        script.append("ttk::style configure TFrame -background #f0f0f0")
+        script.append("ttk::style configure TText -background #ffffff -foreground #000000")
 
-        self.style.configure("Delete.TButton", padding=10, relief="flat", background="#f44336", foreground="white")
-        self.style.map("Delete.TButton", background=[('active', '#d32f2f')])
-
-        # Add ReadAloud button style
-        self.style.configure("ReadAloud.TButton", padding=10, relief="flat", background="#2196F3", foreground="white")
-        self.style.map("ReadAloud.TButton", background=[('active', '#1976D2')])
+        self.root.tk.eval("\n".join(script))
 
     def create_recording_ui(self):
         """
@@ -655,8 +956,9 @@ class AudioTranscriberApp:
         list_frame = ttk.Frame(self.history_frame)
         list_frame.pack(side=tk.TOP, fill=tk.BOTH, expand=True, padx=5, pady=5)
 
-        # History listbox
-        self.history_listbox = tk.Listbox(list_frame, height=10)
+        # History listbox, filled through a list variable so updates are a single Tcl call
+        self.history_items = tk.Variable(value=())
+        self.history_listbox = tk.Listbox(list_frame, height=10, listvariable=self.history_items)
         self.history_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         self.history_listbox.bind('<<ListboxSelect>>', self.on_history_select)
 
@@ -783,7 +1085,7 @@ class AudioTranscriberApp:
         """
         Updates the profile selection dropdown with available profiles.
         """
-        profiles = ["New Profile"] + list(self.settings.get("profiles", {}).keys())
+        profiles = ["New Profile", *self.get_profile_names()]
         self.profile_selection_dropdown['values'] = profiles
         if self.profile_selection_var.get() not in profiles:
             self.profile_selection_var.set("New Profile")
@@ -798,8 +1100,7 @@ class AudioTranscriberApp:
         if confirm:
             del self.settings["profiles"][selected_profile]
             self.save_config()
-            self.update_profile_selection_dropdown()
-            self.update_recording_profile_dropdown()
+            self.refresh_profile_dropdowns()
             self.profile_name_entry.delete(0, tk.END)
             self.profile_desc_text.delete("1.0", tk.END)
             messagebox.showinfo("Success", f"Profile '{selected_profile}' deleted successfully.")
@@ -832,20 +1133,39 @@ class AudioTranscriberApp:
             messagebox.showerror("Error", "Profile name cannot be empty.")
             return
 
-        self.settings.setdefault("profiles", {})[profile_name] = profile_desc
+        profiles = self.settings.setdefault("profiles", {})
+        is_new = profile_name not in profiles
+        profiles[profile_name] = profile_desc
         self.save_config()
-        self.update_profile_selection_dropdown()
-        self.update_recording_profile_dropdown()
+        if is_new:
+            # Editing an existing profile's description leaves the dropdowns unchanged
+            self.refresh_profile_dropdowns()
 
         # Set the selected profile to the saved one
         self.profile_selection_var.set(profile_name)
         messagebox.showinfo("Success", f"Profile '{profile_name}' saved successfully.")
 
+    def refresh_profile_dropdowns(self):
+        """
+        Rebuilds the cached profile names once and updates both profile dropdowns from them.
+        """
+        self._profile_names = None
+        self.update_profile_selection_dropdown()
+        self.update_recording_profile_dropdown()
+
+    def get_profile_names(self):
+        """
+        Returns the saved profile names, rebuilt only after a profile is saved or deleted.
+        """
+        if self._profile_names is None:
+            self._profile_names = tuple(self.settings.get("profiles", {}))
+        return self._profile_names
+
     def update_recording_profile_dropdown(self):
         """
         Updates the recording profile dropdown with available profiles.
         """
-        profiles = ["No Profile"] + list(self.settings.get("profiles", {}).keys())
+        profiles = ["No Profile", *self.get_profile_names()]
         self.recording_profile_dropdown['values'] = profiles
         if self.recording_profile_var.get() not in profiles:
             self.recording_profile_var.set("No Profile")
@@ -854,11 +1174,12 @@ class AudioTranscriberApp:
         """
         Binds keyboard shortcuts and initializes the transcription queue processing.
         """
-        # Bind keyboard shortcuts using pynput for global hotkeys
-        self.initialize_global_hotkeys()
+        # Bind keyboard shortcuts using pynput for global hotkeys once the window is up
+        self.root.after(500, self.initialize_global_hotkeys)
 
-        # Start processing transcription queue
-        self.root.after(100, self.process_transcription_queue)
+        # Drain the transcription queue whenever a worker posts to it
+        self.root.bind('<<NewTranscription>>', self.process_transcription_queue)
+        self.root.after(1000, self.watch_transcription_queue)
 
         # Clear search bar
         self.search_entry.delete(0, tk.END)
@@ -919,29 +1240,47 @@ class AudioTranscriberApp:
             self.CHANNELS = min(device_info['max_input_channels'], 2)  # Use max 2 channels
             self.RATE = int(device_info['default_samplerate'])
 
-            with sd.InputStream(samplerate=self.RATE, channels=self.CHANNELS, dtype=self.FORMAT, blocksize=self.CHUNK) as stream:
-                frames = []
-                while self.recording and not self.cancel_recording:
+            # Frames are written to disk by a separate thread as they are captured
+            with wave.open(self.WAVE_OUTPUT_FILENAME, 'wb') as wf:
+                wf.setnchannels(self.CHANNELS)
+                wf.setsampwidth(np.dtype(self.FORMAT).itemsize)
+                wf.setframerate(self.RATE)
+
+                # Thirty seconds of slack between capture and disk
+                ring = AudioRingBuffer(self.RATE * 30, self.CHANNELS, self.FORMAT)
+                writer_thread = threading.Thread(target=self.write_wav_from_ring, args=(wf, ring), daemon=True)
+                writer_thread.start()
+                input_errors = []
+
+                def audio_callback(indata, frames, time_info, status):
+                    # Runs on PortAudio's thread: only copy into the ring, never block
+                    if status:
+                        input_errors.append(status)
                     if not self.paused:
-                        data, _ = stream.read(self.CHUNK)
-                        frames.append(data)
-                    else:
-                        time.sleep(0.1)
-
-                if self.cancel_recording:
-                    self.update_status("Recording cancelled.", "warning")
-                    self.play_sound('cancel.wav')
-                    return
-
-                # Save recorded frames to a WAV file
-                with wave.open(self.WAVE_OUTPUT_FILENAME, 'wb') as wf:
-                    wf.setnchannels(self.CHANNELS)
-                    wf.setsampwidth(np.dtype(self.FORMAT).itemsize)
-                    wf.setframerate(self.RATE)
-                    wf.writeframes(b''.join(frames))
-
-                self.update_status("Recording finished. Transcribing...", "info")
-                self.transcribe_audio(self.WAVE_OUTPUT_FILENAME)
+                        ring.write(indata)
+
+                try:
+                    with sd.InputStream(samplerate=self.RATE, channels=self.CHANNELS, dtype=self.FORMAT,
+                                        blocksize=self.CHUNK, callback=audio_callback):
+                        while self.recording and not self.cancel_recording:
+                            sd.sleep(100)
+                finally:
+                    ring.close()
+                    writer_thread.join()
+
+                if input_errors:
+                    logging.warning(f"Audio input reported {len(input_errors)} errors, last: {input_errors[-1]}")
+                if ring.dropped_frames:
+                    logging.warning(f"Recording buffer overflowed; dropped {ring.dropped_frames} frames.")
+
+            if self.cancel_recording:
+                os.remove(self.WAVE_OUTPUT_FILENAME)
+                self.update_status("Recording cancelled.", "warning")
+                self.play_sound('cancel.wav')
+                return
+
+            self.update_status("Recording finished. Transcribing...", "info")
+            self.transcribe_audio(self.WAVE_OUTPUT_FILENAME)
         except sd.PortAudioError as e:
             logging.error(f"Failed to access audio device: {e}")
             self.update_status("Failed to access audio device. Check your microphone settings.", "error")
@@ -951,9 +1290,27 @@ class AudioTranscriberApp:
         finally:
             self.recording = False
             self.cancel_recording = False
-            self.root.after(0, lambda: self.record_button.config(text="Start Recording (Alt+R)", style="Record.TButton"))
-            self.root.after(0, lambda: self.cancel_button.config(state=tk.DISABLED))
-            self.root.after(0, lambda: self.update_timer_label("Recording: 00:00", "info"))
+            self.root.after(0, self.reset_recording_controls)
+
+    def reset_recording_controls(self):
+        """
+        Returns the record and cancel buttons and the timer label to their idle state.
+        """
+        self.record_button.config(text="Start Recording (Alt+R)", style="Record.TButton")
+        self.cancel_button.config(state=tk.DISABLED)
+        self.update_timer_label("Recording: 00:00", "info")
+
+    def write_wav_from_ring(self, wf, ring):
+        """
+        Writes frames from the recording ring buffer to the open WAV file until the ring is closed.
+        Each write hands a view of the ring straight to the file, without copying the frames.
+        """
+        while True:
+            frames = ring.read()
+            if frames is None:
+                break
+            wf.writeframesraw(memoryview(frames))
+            ring.consume(len(frames))
 
     def transcribe_audio(self, file_path):
         """
@@ -963,6 +1320,7 @@ class AudioTranscriberApp:
             self.update_status("API key is missing. Please set it in the settings.", "error")
             return
 
+        self.cancel_transcription = False
         file_size = os.path.getsize(file_path) / (1024 * 1024)  # Size in MB
         self.update_status(f"Processing audio file ({file_size:.2f}MB)...", "info")
 
@@ -989,8 +1347,8 @@ class AudioTranscriberApp:
 
             try:
                 # Check if a profile is selected
-                if self.recording_profile_var.get() != "No Profile":
-                    profile_name = self.recording_profile_var.get()
+                profile_name = self.recording_profile_var.get()
+                if profile_name != "No Profile":
                     profile_description = self.settings["profiles"].get(profile_name, "")
                     self.update_status("Processing transcription with profile instructions...", "info")
                     processed_transcription = self.process_with_gpt(transcription, profile_description)
@@ -1003,10 +1361,8 @@ class AudioTranscriberApp:
                     raise TypeError(f"Expected string, got {type(transcription)}")
 
                 logging.info("Transcription completed successfully")
-                self.transcription_queue.put(("insert", transcription))
-                self.transcription_history.append(transcription)
-                self.update_history_list()
-                self.save_transcription_history()
+                self.post_to_ui("insert", transcription)
+                self.post_to_ui("history", transcription)
                 pyperclip.copy(transcription)
                 self.update_status("Transcription complete and copied to clipboard.", "info")
                 
@@ -1020,10 +1376,8 @@ class AudioTranscriberApp:
                 logging.error(f"Error processing transcription: {e}")
                 self.update_status(f"Error processing transcription: {e}", "error")
                 # If there's an error in processing, still save the original transcription
-                self.transcription_queue.put(("insert", transcription))
-                self.transcription_history.append(transcription)
-                self.update_history_list()
-                self.save_transcription_history()
+                self.post_to_ui("insert", transcription)
+                self.post_to_ui("history", transcription)
         except requests.exceptions.Timeout:
             logging.error("API request timed out.")
             self.update_status("API request timed out. Please try again later.", "error")
@@ -1037,6 +1391,17 @@ class AudioTranscriberApp:
             self.cancel_button.config(state=tk.DISABLED, text="Cancel")
             self.progress.pack_forget()  # Hide progress bar after transcription
 
+    def get_history_prompt_text(self):
+        """
+        Returns the transcription history formatted as numbered entries for a GPT prompt.
+        Only entries appended since the last call are formatted.
+        """
+        with self.history_prompt_lock:
+            parts = self.history_prompt_parts
+            for i in range(len(parts), len(self.transcription_history)):
+                parts.append(f"Entry {i + 1}:\n{self.transcription_history[i]}")
+            return "\n\n".join(parts)
+
     def process_with_gpt(self, transcription, profile_description):
         """
         Processes the transcription text using GPT based on the selected profile.
@@ -1047,10 +1412,6 @@ class AudioTranscriberApp:
 
         try:
             url = "https://api.openai.com/v1/chat/completions"
-            headers = {
-                "Authorization": f"Bearer {self.API_KEY}",
-                "Content-Type": "application/json"
-            }
             model = self.settings.get("gpt_model", "gpt-4")
 
             # Prepare the messages array
@@ -1060,13 +1421,8 @@ class AudioTranscriberApp:
 
             # If send history is enabled and there's history, include it
             if self.send_history_var.get() and self.transcription_history:
-                # Format the entire conversation history
-                formatted_history = []
-                for i, hist_entry in enumerate(self.transcription_history, 1):
-                    formatted_history.append(f"Entry {i}:\n{hist_entry}")
-                
-                history_text = "\n\n".join(formatted_history)
-                
+                history_text = self.get_history_prompt_text()
+
                 # Create a comprehensive prompt with the entire history
                 prompt = (
                     "Here is the complete conversation history:\n\n"
@@ -1091,7 +1447,7 @@ class AudioTranscriberApp:
                 "messages": messages
             }
             
-            response = requests.post(url, headers=headers, json=data, timeout=60)
+            response = self.http.post(url, json=data, timeout=60)
             if response.status_code == 200:
                 result = response.json()
                 if result and 'choices' in result and len(result['choices']) > 0:
@@ -1106,61 +1462,158 @@ class AudioTranscriberApp:
             self.update_status(f"An error occurred during GPT processing: {e}", "error")
             return transcription  # Return original transcription if error occurs
 
-    def transcribe_large_file(self, file_path):
+    def transcribe_large_file(self, file_path, show_progress=True):
         """
-        Splits large audio files into chunks and transcribes each chunk individually.
+        Splits large audio files at quiet points into roughly one-minute chunks and transcribes them
+        on a bounded thread pool. Each chunk is submitted as soon as it has been written, and results
+        are joined in their original order. Pass show_progress=False when the caller owns the progress bar.
         """
-        self.cancel_transcription = False
-        chunk_duration = 60 * 1000  # 60 seconds in milliseconds
-        audio = AudioSegment.from_file(file_path)
-        chunks = [audio[i:i + chunk_duration] for i in range(0, len(audio), chunk_duration)]
+        # A private directory per call, so concurrent large-file jobs never share chunk names
+        chunk_dir = tempfile.mkdtemp(prefix='transcribe_chunks_')
+        pool = ThreadPoolExecutor(max_workers=int(self.settings.get('parallel_chunks', 4)))
+        try:
+            if show_progress:
+                self.progress['value'] = 0
+                self.progress.pack(fill=tk.X, pady=5)
+            futures = {}
+            for i, chunk_file in enumerate(self.export_audio_chunks(file_path, chunk_dir)):
+                if self.cancel_transcription:
+                    raise Exception("Transcription cancelled by user")
+                futures[pool.submit(self.transcribe_normal, chunk_file)] = i
+
+            self.update_status(f"Transcribing {len(futures)} chunks...", "info")
+            self.post_to_ui("insert", f"Transcribing {len(futures)} chunks...")
+            transcriptions = [None] * len(futures)
+            for done, future in enumerate(as_completed(futures), 1):
+                if self.cancel_transcription:
+                    raise Exception("Transcription cancelled by user")
+                transcriptions[futures[future]] = future.result()
+                self.update_status(f"Transcribed chunk {done} of {len(futures)}...", "info")
+                if show_progress:
+                    self.progress['value'] = (done / len(futures)) * 100
+        finally:
+            # Drop chunks that haven't started; wait for in-flight uploads before deleting their files
+            pool.shutdown(wait=True, cancel_futures=True)
+            shutil.rmtree(chunk_dir, ignore_errors=True)
 
-        transcriptions = []
-        for i, chunk in enumerate(chunks):
-            if self.cancel_transcription:
-                raise Exception("Transcription cancelled by user")
-            self.update_status(f"Transcribing chunk {i + 1} of {len(chunks)}...", "info")
-            transcription = f"Transcribing chunk {i + 1}..."
-            self.transcription_queue.put(("insert", transcription))
-            self.progress['value'] = ((i + 1) / len(chunks)) * 100
-            self.progress.pack(fill=tk.X, pady=5)
-            chunk_file = f"temp_chunk_{i}.wav"
-            chunk.export(chunk_file, format="wav")
+        return " ".join(transcriptions)
+
+    def export_audio_chunks(self, file_path, chunk_dir):
+        """
+        Splits an audio file into WAV chunks in chunk_dir, yielding each chunk's path once it is written.
+        PCM WAV input is memory-mapped and each chunk's PCM is written straight from the mapping behind
+        a fresh header; other formats, and WAV variants the wave module can't read (such as IEEE float),
+        are decoded with pydub.
+        """
+        wf = None
+        if file_path.lower().endswith('.wav'):
             try:
-                chunk_transcription = self.transcribe_normal(chunk_file)
-                transcriptions.append(chunk_transcription)
-            finally:
-                if os.path.exists(chunk_file):
-                    os.remove(chunk_file)
+                wf = wave.open(file_path, 'rb')
+            except (wave.Error, EOFError) as e:
+                logging.info(f"Falling back to pydub for {file_path}: {e}")
+
+        if wf is not None:
+            with wf, open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                params = wf.getparams()
+                frame_bytes = params.nchannels * params.sampwidth
+                data_offset = self.find_wav_data_offset(mm)
+                sample_dtype = {1: np.uint8, 2: '<i2', 4: '<i4'}.get(params.sampwidth)
+
+                def read_frames(start, count):
+                    if sample_dtype is None:
+                        return None  # 24-bit audio: cut at fixed offsets
+                    wf.setpos(start)
+                    frames = np.frombuffer(wf.readframes(count), dtype=sample_dtype).reshape(-1, params.nchannels)
+                    # 8-bit WAV is unsigned around 128
+                    return frames.astype(np.int16) - 128 if params.sampwidth == 1 else frames
+
+                boundaries = self.find_chunk_boundaries(read_frames, params.nframes, params.framerate)
+                for i, (start, end) in enumerate(zip(boundaries, boundaries[1:])):
+                    chunk_file = os.path.join(chunk_dir, f"temp_chunk_{i}.wav")
+                    with open(chunk_file, 'wb') as out, memoryview(mm) as pcm:
+                        out.write(self.build_wav_header(params, end - start))
+                        out.write(pcm[data_offset + start * frame_bytes:data_offset + end * frame_bytes])
+                    yield chunk_file
+        else:
+            from pydub import AudioSegment
 
-        return " ".join(transcriptions)
+            audio = AudioSegment.from_file(file_path)
+            samples = np.asarray(audio.get_array_of_samples()).reshape(-1, audio.channels)
+            boundaries = self.find_chunk_boundaries(
+                lambda start, count: samples[start:start + count], len(samples), audio.frame_rate
+            )
+            for i, (start, end) in enumerate(zip(boundaries, boundaries[1:])):
+                chunk_file = os.path.join(chunk_dir, f"temp_chunk_{i}.wav")
+                audio.get_sample_slice(start, end).export(chunk_file, format="wav")
+                yield chunk_file
+
+    def find_wav_data_offset(self, buf):
+        """
+        Returns the byte offset of the PCM payload in a RIFF/WAVE buffer by walking its chunk headers.
+        """
+        pos = 12  # Skip the RIFF header and WAVE tag
+        while pos + 8 <= len(buf):
+            chunk_id, size = struct.unpack_from('<4sI', buf, pos)
+            if chunk_id == b'data':
+                return pos + 8
+            pos += 8 + size + (size & 1)  # Chunks are padded to an even length
+        raise ValueError("WAV file has no data chunk")
+
+    def build_wav_header(self, params, nframes):
+        """
+        Returns a 44-byte PCM WAV header for nframes frames in the given wave parameters.
+        """
+        block_align = params.nchannels * params.sampwidth
+        data_size = nframes * block_align
+        return struct.pack(
+            '<4sI4s4sIHHIIHH4sI',
+            b'RIFF', 36 + data_size, b'WAVE',
+            b'fmt ', 16, 1, params.nchannels, params.framerate,
+            params.framerate * block_align, block_align, params.sampwidth * 8,
+            b'data', data_size
+        )
+
+    def find_chunk_boundaries(self, read_frames, total_frames, frame_rate, chunk_seconds=60, search_seconds=5):
+        """
+        Returns frame offsets that split audio into pieces of at most chunk_seconds.
+        read_frames(start, count) must return a (frames, channels) array, or None if levels can't be read.
+        Each cut is moved back to the quietest 30 ms window in the preceding search_seconds,
+        so chunks end in a pause rather than mid-word.
+        """
+        window = max(1, int(frame_rate * 0.03))
+        chunk_frames = chunk_seconds * frame_rate
+        search_frames = search_seconds * frame_rate
+
+        boundaries = [0]
+        while total_frames - boundaries[-1] > chunk_frames:
+            target = boundaries[-1] + chunk_frames
+            search_start = max(boundaries[-1] + window, target - search_frames)
+            windows = (target - search_start) // window
+            frames = read_frames(search_start, windows * window) if windows > 0 else None
+            if frames is not None and len(frames) == windows * window:
+                level = np.abs(frames.astype(np.float32)).mean(axis=1)
+                quietest = int(np.argmin(level.reshape(windows, window).mean(axis=1)))
+                boundaries.append(search_start + quietest * window)
+            else:
+                boundaries.append(target)
+        boundaries.append(total_frames)
+        return boundaries
 
     def transcribe_normal(self, file_path):
         """
         Sends the audio file to the transcription API and returns the transcribed text.
         """
-        self.cancel_transcription = False
         url = "https://api.openai.com/v1/audio/transcriptions"
-        headers = {"Authorization": f"Bearer {self.API_KEY}"}
-        self.FORMAT = 'int16'
-        self.CHANNELS = 2
-        self.RATE = int(self.settings.get('sample_rate', 44100))
-        self.CHUNK = 1024
-        self.WAVE_OUTPUT_FILENAME = "output.wav"
-
-        self.update_status("Preparing audio file for upload...", "info")
-        with open(file_path, 'rb') as f:
-            file_data = f.read()
 
         self.update_status("Uploading audio file to API...", "info")
         try:
-            response = requests.post(
-                url,
-                headers=headers,
-                files={'file': ('audio.wav', file_data)},
-                data={'model': self.settings.get("transcription_model", "whisper-1")},
-                timeout=300  # Extended timeout for large files
-            )
+            with open(file_path, 'rb') as f:
+                response = self.http.post(
+                    url,
+                    files={'file': (os.path.basename(file_path), f)},
+                    data={'model': self.settings.get("transcription_model", "whisper-1")},
+                    timeout=300  # Extended timeout for large files
+                )
         except requests.exceptions.RequestException as e:
             logging.error(f"API request failed: {e}")
             self.update_status(f"API request failed: {e}", "error")
@@ -1195,25 +1648,100 @@ class AudioTranscriberApp:
             self.update_status("Transcribing audio file...", "info")
             threading.Thread(target=self.transcribe_audio, args=(file_path,), daemon=True).start()
 
-    def process_transcription_queue(self):
+    def bulk_transcribe_files(self):
+        """
+        Opens a file dialog for the user to select several audio files and transcribes them into the history.
+        """
+        file_paths = filedialog.askopenfilenames(
+            filetypes=[("Audio files", "*.wav;*.mp3;*.ogg;*.flac")]
+        )
+        if file_paths and self.check_api_key():
+            self.update_status(f"Transcribing {len(file_paths)} audio files...", "info")
+            threading.Thread(target=self._bulk_transcribe_thread, args=(file_paths,), daemon=True).start()
+
+    def _bulk_transcribe_thread(self, file_paths):
+        """
+        Thread function that transcribes several files concurrently and queues the results for the history.
+        """
+        self.cancel_transcription = False
+        def transcribe_file(file_path):
+            try:
+                if os.path.getsize(file_path) > 25 * 1024 * 1024:
+                    # The bulk job drives the progress bar per file; concurrent large files mustn't fight over it
+                    return self.transcribe_large_file(file_path, show_progress=False)
+                return self.transcribe_normal(file_path)
+            except Exception as e:
+                logging.error(f"Error transcribing {file_path}: {e}")
+                return None
+
+        self.root.after(0, lambda: self.progress.configure(value=0))
+        self.root.after(0, lambda: self.progress.pack(fill=tk.X, pady=5))
+        transcriptions = [None] * len(file_paths)
+        try:
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                futures = {pool.submit(transcribe_file, path): i for i, path in enumerate(file_paths)}
+                for done, future in enumerate(as_completed(futures), 1):
+                    transcriptions[futures[future]] = future.result()
+                    self.root.after(0, lambda v=done / len(futures) * 100: self.progress.configure(value=v))
+        finally:
+            self.root.after(0, self.progress.pack_forget)
+
+        failed = 0
+        for transcription in transcriptions:
+            # transcribe_normal reports API failures as "Error: ..." text rather than raising
+            if transcription is None or transcription.startswith("Error:"):
+                failed += 1
+            else:
+                self.post_to_ui("history", transcription)
+
+        if failed:
+            self.root.after(0, lambda: self.update_status(
+                f"Bulk transcription finished: {len(file_paths) - failed} succeeded, {failed} failed.", "warning"))
+        else:
+            self.root.after(0, lambda: self.update_status(
+                f"Bulk transcription finished: {len(file_paths)} files added to history.", "info"))
+
+    def post_to_ui(self, action, data):
+        """
+        Queues an action for the UI thread and wakes it to process the transcription queue.
+        """
+        self.transcription_queue.put((action, data))
+        self.root.event_generate('<<NewTranscription>>', when='tail')
+
+    def watch_transcription_queue(self):
+        """
+        Drains the transcription queue once a second in case a wake-up event was missed,
+        and reports any history write failures.
+        """
+        self.process_transcription_queue()
+        self.report_history_errors()
+        self.root.after(1000, self.watch_transcription_queue)
+
+    def process_transcription_queue(self, event=None):
         """
         Processes items in the transcription queue and updates the UI accordingly.
         """
+        get_nowait = self.transcription_queue.get_nowait
+        result_text = self.recording_result_text
+        history_changed = False
         try:
-            while not self.transcription_queue.empty():
-                action, data = self.transcription_queue.get_nowait()
+            while True:
+                action, data = get_nowait()
                 if action == "insert":
-                    self.recording_result_text.config(state='normal')
-                    self.recording_result_text.insert(tk.END, data + "\n\n")
-                    self.recording_result_text.config(state='disabled')
+                    result_text.config(state='normal')
+                    result_text.insert(tk.END, data + "\n\n")
+                    result_text.config(state='disabled')
                 elif action == "history":
                     self.transcription_history.append(data)
-                    self.update_history_list()
-                    self.save_transcription_history()  # Save after adding new transcription
+                    self.history_lower.append(data.lower())
+                    self.history_display.append(self.history_display_text(data))
+                    self.append_to_history_journal(data)
+                    history_changed = True
         except queue.Empty:
             pass
-        finally:
-            self.root.after(100, self.process_transcription_queue)
+        if history_changed:
+            # Refresh the listbox once for everything drained in this pass
+            self.update_history_list()
 
     def cancel_transcription_action(self):
         """
@@ -1255,7 +1783,20 @@ class AudioTranscriberApp:
     def update_status(self, message, status_type="info"):
         """
         Updates the status label with the provided message and color based on status type.
+        Updates arriving before the UI next goes idle are collapsed into the latest one.
+        """
+        self.pending_status = (message, status_type)
+        if not self.status_flush_scheduled:
+            self.status_flush_scheduled = True
+            self.root.after_idle(self.flush_status)
+
+    def flush_status(self):
         """
+        Applies the most recent status passed to update_status.
+        """
+        # Clear the flag first so an update arriving meanwhile schedules another flush
+        self.status_flush_scheduled = False
+        message, status_type = self.pending_status
         status_colors = {
             "info": "#4CAF50",    # Green
             "error": "#f44336",   # Red
@@ -1294,23 +1835,37 @@ class AudioTranscriberApp:
         textbox.delete(1.0, tk.END)
         textbox.config(state='disabled')
 
-    def update_history_list(self, filtered_history=None):
+    def history_display_text(self, item):
         """
-        Updates the transcription history listbox with the provided history data.
+        Returns the text shown in the history listbox for a transcription.
         """
-        self.history_listbox.delete(0, tk.END)
-        history_to_display = filtered_history if filtered_history is not None else self.transcription_history
-        for item in history_to_display:
-            display_text = item[:50] + "..." if len(item) > 50 else item
-            self.history_listbox.insert(tk.END, display_text)
+        return item[:50] + "..." if len(item) > 50 else item
+
+    def update_history_list(self, filtered_display=None):
+        """
+        Updates the transcription history listbox with the provided display strings,
+        or with the whole history when none are given.
+        """
+        self.history_items.set(tuple(filtered_display if filtered_display is not None else self.history_display))
 
     def on_search(self, event):
+        """
+        Schedules filtering of the transcription history, restarting the delay on each keystroke.
+        """
+        if self.search_job is not None:
+            self.root.after_cancel(self.search_job)
+        self.search_job = self.root.after(150, self.run_search)
+
+    def run_search(self):
         """
         Filters the transcription history based on the search query.
         """
+        self.search_job = None
         query = self.search_entry.get().lower()
-        filtered_history = [item for item in self.transcription_history if query in item.lower()]
-        self.update_history_list(filtered_history)
+        filtered_display = [
+            self.history_display[i] for i, item in enumerate(self.history_lower) if query in item
+        ]
+        self.update_history_list(filtered_display)
 
     def on_history_select(self, event):
         """
@@ -1339,10 +1894,14 @@ class AudioTranscriberApp:
             confirm = messagebox.askyesno("Confirm", "Clear selected history?")
             if confirm:
                 self.transcription_history.pop(selected_index[0])
+                self.history_lower.pop(selected_index[0])
+                self.history_display.pop(selected_index[0])
+                with self.history_prompt_lock:
+                    self.history_prompt_parts = []
                 self.update_history_list()
                 self.clear_textbox(self.history_result_text)
                 self.search_entry.delete(0, tk.END)  # Clear search bar
-                self.save_transcription_history()  # Save after removing transcription
+                self.mark_history_dirty()
 
     def clear_all_history(self):
         """
@@ -1351,10 +1910,14 @@ class AudioTranscriberApp:
         confirm = messagebox.askyesno("Confirm", "Clear all history?")
         if confirm:
             self.transcription_history.clear()
+            self.history_lower.clear()
+            self.history_display.clear()
+            with self.history_prompt_lock:
+                self.history_prompt_parts = []
             self.update_history_list()
             self.clear_textbox(self.history_result_text)
             self.search_entry.delete(0, tk.END)  # Clear search bar
-            self.save_transcription_history()  # Save the empty state
+            self.mark_history_dirty()
 
     def browse_directory(self, entry_widget):
         """
@@ -1402,36 +1965,65 @@ class AudioTranscriberApp:
                         for item in self.transcription_history:
                             file.write(item + "\n\n")
                 elif ext == ".docx":
+                    from docx import Document
                     doc = Document()
                     for item in self.transcription_history:
                         doc.add_paragraph(item)
                     doc.save(file_path)
                 elif ext == ".pdf":
-                    pdf = FPDF()
-                    pdf.add_page()
-                    pdf.set_auto_page_break(auto=True, margin=15)
-                    pdf.set_font("Arial", size=12)
-                    for item in self.transcription_history:
-                        # Split text into lines to prevent overflow
-                        for line in item.split('\n'):
-                            pdf.multi_cell(0, 10, line)
-                        pdf.ln()
-                    pdf.output(file_path)
+                    self.export_pdf(file_path)
                 self.update_status(f"Transcriptions exported to {file_path}", "info")
             except Exception as e:
                 logging.error(f"Error exporting transcriptions: {e}")
                 self.update_status(f"Error exporting transcriptions: {e}", "error")
 
+    def export_pdf(self, file_path):
+        """
+        Writes the transcription history to a PDF, using reportlab when it is installed
+        and falling back to FPDF otherwise.
+        """
+        try:
+            from reportlab.lib.styles import getSampleStyleSheet
+            from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer
+        except ImportError:
+            from fpdf import FPDF
+            pdf = FPDF()
+            pdf.add_page()
+            pdf.set_auto_page_break(auto=True, margin=15)
+            pdf.set_font("Arial", size=12)
+            for item in self.transcription_history:
+                # multi_cell wraps long lines and honours embedded newlines
+                pdf.multi_cell(0, 10, item)
+                pdf.ln()
+            pdf.output(file_path)
+            return
+
+        from xml.sax.saxutils import escape
+        style = getSampleStyleSheet()["Normal"]
+        story = []
+        for item in self.transcription_history:
+            story.append(Paragraph(escape(item).replace('\n', '<br/>'), style))
+            story.append(Spacer(1, 12))
+        SimpleDocTemplate(file_path).build(story)
+
     def load_transcription_history(self):
         """
         Loads the transcription history from the history file.
         """
+        if self.history_dirty:
+            self.save_transcription_history()
+        # Let queued writes land before reading the files back
+        self.history_writer.submit(lambda: None).result()
+        self.report_history_errors()
         if os.path.exists(self.history_file):
             try:
-                with open(self.history_file, 'r', encoding='utf-8') as f:
-                    history = json.load(f)
+                with open(self.history_file, 'rb') as f:
+                    data = f.read()
+                history = orjson.loads(data) if orjson else json.loads(data)
                 if isinstance(history, list):
                     self.transcription_history = history
+                    self.history_base = self.history_digest(data)
+                    self.replay_history_journal()
                     logging.info("Transcription history loaded successfully.")
                 else:
                     logging.error("Invalid transcription history format. Starting with empty history.")
@@ -1445,6 +2037,68 @@ class AudioTranscriberApp:
         else:
             logging.info("No transcription history file found. Starting with empty history.")
             self.transcription_history = []
+            self.history_base = self.history_digest(b"")
+            self.replay_history_journal()
+        self.history_lower = [item.lower() for item in self.transcription_history]
+        self.history_display = [self.history_display_text(item) for item in self.transcription_history]
+        with self.history_prompt_lock:
+            self.history_prompt_parts = []
+
+    def replay_history_journal(self):
+        """
+        Appends entries from the history journal that are not yet in the consolidated history file.
+        Each journal line records the entry's position and a digest of the file it was appended to,
+        so lines left over from an earlier file (say, after a crash just before the journal was removed)
+        and lines already consolidated are skipped, and a partially written last line is ignored.
+        """
+        if not os.path.exists(self.history_journal_file):
+            return
+        replayed = 0
+        try:
+            with open(self.history_journal_file, 'rb') as f:
+                for line in f:
+                    try:
+                        entry = orjson.loads(line) if orjson else json.loads(line)
+                    except ValueError:
+                        logging.warning("Ignoring unreadable line in transcription history journal.")
+                        break
+                    if entry.get("base") == self.history_base and entry["index"] == len(self.transcription_history):
+                        self.transcription_history.append(entry["text"])
+                        replayed += 1
+        except Exception as e:
+            logging.error(f"Error reading transcription history journal: {e}")
+        if replayed:
+            self.unsaved_history_count = replayed
+            logging.info(f"Recovered {replayed} transcription(s) from the history journal.")
+
+    def append_to_history_journal(self, text):
+        """
+        Queues the newest history entry for the journal and schedules consolidation of the
+        full history file after 50 new entries or 30 seconds, whichever comes first.
+        """
+        if self.history_dirty:
+            # Journal indices are only valid against the saved file, so rewrite it instead
+            self.save_transcription_history()
+            return
+
+        entry = {"index": len(self.transcription_history) - 1, "text": text}
+        self.history_writer.submit(self.write_history_journal, entry)
+
+        self.unsaved_history_count += 1
+        if self.unsaved_history_count >= 50:
+            self.save_transcription_history()
+        elif self.history_save_job is None:
+            self.history_save_job = self.root.after(30000, self.save_transcription_history)
+
+    def mark_history_dirty(self):
+        """
+        Schedules a rewrite of the history file two seconds after the latest removal,
+        so a run of deletions is saved once.
+        """
+        self.history_dirty = True
+        if self.history_save_job is not None:
+            self.root.after_cancel(self.history_save_job)
+        self.history_save_job = self.root.after(2000, self.save_transcription_history)
 
     def load_previous_transcriptions(self):
         """
@@ -1456,17 +2110,88 @@ class AudioTranscriberApp:
 
     def save_transcription_history(self):
         """
-        Saves the transcription history to the history file safely using a temporary file.
+        Queues a snapshot of the transcription history to be written to the history file.
+        """
+        if self.history_save_job is not None:
+            self.root.after_cancel(self.history_save_job)
+            self.history_save_job = None
+        self.unsaved_history_count = 0
+        self.history_dirty = False
+        self.history_writer.submit(self.write_history_file, list(self.transcription_history))
+
+    def write_history_journal(self, entry):
+        """
+        Appends one entry to the history journal. Runs on the history writer thread.
+        """
+        try:
+            # Stamped here, in write order, so it names the file written just before this line
+            entry["base"] = self.history_base
+            if self.history_journal is None:
+                self.history_journal = open(self.history_journal_file, 'a', encoding='utf-8', buffering=1)
+            self.history_journal.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        except Exception as e:
+            logging.error(f"Error writing transcription history journal: {e}")
+            self.history_errors.put(("journal", str(e)))
+
+    @staticmethod
+    def history_digest(data):
+        """
+        Returns a short digest identifying the contents of a consolidated history file.
+        """
+        return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+    def write_history_file(self, history):
+        """
+        Writes history to the history file safely using a temporary file, then empties the
+        history journal whose entries it now contains. Runs on the history writer thread.
         """
         try:
             temp_file = f"{self.history_file}.tmp"
-            with open(temp_file, 'w', encoding='utf-8') as f:
-                json.dump(self.transcription_history, f, ensure_ascii=False, indent=2)
-            shutil.move(temp_file, self.history_file)
+            # Serialize up front so the file gets one write() instead of one per JSON token
+            # Stored compactly; loading accepts indented files written by older versions
+            if orjson:
+                data = orjson.dumps(history)
+            else:
+                data = json.dumps(history, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+            with open(temp_file, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_file, self.history_file)
+            self.history_base = self.history_digest(data)
+            if self.history_journal is not None:
+                self.history_journal.close()
+                self.history_journal = None
+            if os.path.exists(self.history_journal_file):
+                os.remove(self.history_journal_file)
             logging.info("Transcription history saved successfully.")
         except Exception as e:
             logging.error(f"Error saving transcription history: {e}")
-            messagebox.showerror("Save Error", f"Failed to save transcription history: {e}")
+            self.history_errors.put(("save", str(e)))
+
+    def report_history_errors(self, resave=True):
+        """
+        Handles failures queued by the history writer thread; a failed save is shown to the user.
+        A failed journal append is retried as a full save when resave is True; pass False once the
+        writer has been shut down and can take no more work. Runs on the UI thread.
+        """
+        save_errors = []
+        journal_failed = False
+        while True:
+            try:
+                kind, message = self.history_errors.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "journal":
+                journal_failed = True
+            else:
+                save_errors.append(message)
+        if save_errors:
+            # Retry with a full save on the next change or on exit
+            self.history_dirty = True
+            messagebox.showerror("Save Error", f"Failed to save transcription history: {save_errors[-1]}")
+        elif journal_failed and resave:
+            self.save_transcription_history()
 
     def on_minimize(self):
         """
@@ -1484,16 +2209,29 @@ class AudioTranscriberApp:
                 self.tray_icon.stop()
             if hasattr(self, 'hotkey_listener'):
                 self.hotkey_listener.stop()
+            if self.async_loop is not None:
+                self.async_loop.call_soon_threadsafe(self.async_loop.stop)
+            if self.unsaved_history_count or self.history_dirty:
+                self.save_transcription_history()
+            self.history_writer.shutdown(wait=True)
+            self.report_history_errors(resave=False)
+            self.http.close()
             self.root.destroy()
 
     def open_settings(self):
         """
         Opens the settings window where users can configure application preferences.
+        The window is built on first use and hidden on close; later opens refresh its fields.
         """
+        if self.settings_window is not None:
+            self.refresh_settings_window()
+            self.show_modal(self.settings_window)
+            return
+
         settings_window = tk.Toplevel(self.root)
         settings_window.title("Settings")
         settings_window.geometry("600x600")
-        settings_window.grab_set()  # Make the settings window modal
+        settings_window.protocol("WM_DELETE_WINDOW", lambda: self.hide_modal(settings_window))
 
         notebook = ttk.Notebook(settings_window)
         notebook.pack(expand=True, fill="both")
@@ -1508,12 +2246,12 @@ class AudioTranscriberApp:
 
         # General Settings
         ttk.Label(general_frame, text="Default Save Location:").pack(pady=5)
-        save_location_entry = ttk.Entry(general_frame, width=40)
+        save_location_var = tk.StringVar()
+        save_location_entry = ttk.Entry(general_frame, width=40, textvariable=save_location_var)
         save_location_entry.pack(pady=5)
-        save_location_entry.insert(0, self.settings.get("save_location", ""))
         ttk.Button(general_frame, text="Browse", command=lambda: self.browse_directory(save_location_entry)).pack(pady=5)
 
-        dark_mode_var = tk.BooleanVar(value=self.settings.get("dark_mode", False))
+        dark_mode_var = tk.BooleanVar()
         ttk.Checkbutton(
             general_frame,
             text="Enable Dark Mode",
@@ -1524,43 +2262,45 @@ class AudioTranscriberApp:
         # Audio Settings
         bitrate_values = ["64 kbps", "128 kbps", "256 kbps"]
         ttk.Label(audio_frame, text="Bitrate:").pack(pady=5)
-        bitrate_combobox = ttk.Combobox(audio_frame, values=bitrate_values, state="readonly")
-        bitrate_combobox.set(self.settings.get("bitrate", bitrate_values[1]))
+        bitrate_var = tk.StringVar()
+        bitrate_combobox = ttk.Combobox(audio_frame, values=bitrate_values, state="readonly", textvariable=bitrate_var)
         bitrate_combobox.pack(pady=5)
 
         sample_rate_values = [22050, 44100, 48000]
         ttk.Label(audio_frame, text="Sample Rate:").pack(pady=5)
-        sample_rate_combobox = ttk.Combobox(audio_frame, values=sample_rate_values, state="readonly")
-        sample_rate_combobox.set(self.settings.get("sample_rate", sample_rate_values[1]))
+        sample_rate_var = tk.IntVar()
+        sample_rate_combobox = ttk.Combobox(
+            audio_frame, values=sample_rate_values, state="readonly", textvariable=sample_rate_var
+        )
         sample_rate_combobox.pack(pady=5)
 
         # Volume Slider
         ttk.Label(audio_frame, text="Volume:").pack(pady=5)
+        volume_var = tk.DoubleVar()
         volume_slider = ttk.Scale(
             audio_frame,
             from_=0,
             to=1,
             orient=tk.HORIZONTAL,
             length=200,
+            variable=volume_var,
             command=lambda val: self.update_volume(float(val))
         )
-        volume_slider.set(self.settings.get("volume", 1.0))
         volume_slider.pack(pady=5)
 
         # API Settings
         ttk.Label(api_frame, text="API Key:").pack(pady=5)
-        api_key_entry = ttk.Entry(api_frame, width=40, show="*")
+        api_key_var = tk.StringVar()
+        api_key_entry = ttk.Entry(api_frame, width=40, show="*", textvariable=api_key_var)
         api_key_entry.pack(pady=5)
-        api_key_entry.insert(0, self.API_KEY or "")
-        api_key_entry.configure(state='normal')  # Enable direct editing
 
         def update_api_key():
             """
             Updates the API key in keyring based on user input.
             """
-            new_api_key = api_key_entry.get().strip()
+            new_api_key = api_key_var.get().strip()
             if new_api_key:
-                keyring.set_password("whisper_api", "api_key", new_api_key)
+                self._set_keyring_api_key(new_api_key)
                 self.settings["api_key"] = new_api_key
                 self.API_KEY = new_api_key
                 logging.info("API key updated and saved securely in keyring.")
@@ -1572,42 +2312,102 @@ class AudioTranscriberApp:
 
         transcription_models = ["whisper-1"]
         ttk.Label(api_frame, text="Transcription Model:").pack(pady=5)
-        model_combobox = ttk.Combobox(api_frame, values=transcription_models, state="readonly")
-        model_combobox.set(self.settings.get("transcription_model", transcription_models[0]))
+        model_var = tk.StringVar()
+        model_combobox = ttk.Combobox(api_frame, values=transcription_models, state="readonly", textvariable=model_var)
         model_combobox.pack(pady=5)
 
         # Profile Model Settings
         profile_models = ["chatgpt-4o-latest", "gpt-4o-mini", "gpt-4o-2024-08-06", "gpt-4o"]
         ttk.Label(api_frame, text="Profile Model:").pack(pady=5)
-        profile_model_combobox = ttk.Combobox(api_frame, values=profile_models, state="readonly")
-        profile_model_combobox.set(self.settings.get("gpt_model", profile_models[0]))
+        profile_model_var = tk.StringVar()
+        profile_model_combobox = ttk.Combobox(
+            api_frame, values=profile_models, state="readonly", textvariable=profile_model_var
+        )
         profile_model_combobox.pack(pady=5)
 
+        def refresh_fields():
+            """
+            Loads the current settings into the window's fields, discarding unsaved edits.
+            """
+            save_location_var.set(self.settings.get("save_location", ""))
+            dark_mode_var.set(self.settings.get("dark_mode", False))
+            bitrate_var.set(self.settings.get("bitrate", bitrate_values[1]))
+            sample_rate_var.set(self.settings.get("sample_rate", sample_rate_values[1]))
+            volume_var.set(self.settings.get("volume", 1.0))
+            api_key_var.set(self.API_KEY or "")
+            model_var.set(self.settings.get("transcription_model", transcription_models[0]))
+            profile_model_var.set(self.settings.get("gpt_model", profile_models[0]))
+
         def save_settings():
             """
             Saves the settings from the settings window to the configuration and keyring.
             """
-            self.settings["save_location"] = save_location_entry.get()
-            self.settings["dark_mode"] = dark_mode_var.get()
-            self.settings["bitrate"] = bitrate_combobox.get()
-            self.settings["sample_rate"] = int(sample_rate_combobox.get())
-            self.settings["transcription_model"] = model_combobox.get()
-            self.settings["gpt_model"] = profile_model_combobox.get()
-            self.settings["volume"] = volume_slider.get()
-
-            # Update API key
-            new_api_key = api_key_entry.get().strip()
+            self.settings.update({
+                "save_location": save_location_var.get(),
+                "dark_mode": dark_mode_var.get(),
+                "bitrate": bitrate_var.get(),
+                "sample_rate": sample_rate_var.get(),
+                "transcription_model": model_var.get(),
+                "gpt_model": profile_model_var.get(),
+                "volume": volume_var.get(),
+            })
+
+            # Update API key, touching the keyring only if it changed
+            new_api_key = api_key_var.get().strip()
+            if new_api_key == self.API_KEY:
+                new_api_key = None
             if new_api_key:
                 self.settings["api_key"] = new_api_key
                 self.API_KEY = new_api_key
-                keyring.set_password("whisper_api", "api_key", new_api_key)
-
-            self.save_config()
             self.update_volume(self.settings["volume"])
-            settings_window.destroy()
+
+            # Keyring and disk writes can be slow, so do them off the UI thread and mark the
+            # window busy until they finish
+            settings_to_save = self.settings.copy()
+            settings_window.tk.call('tk', 'busy', 'hold', settings_window)
+
+            def write_settings():
+                try:
+                    if new_api_key:
+                        self._set_keyring_api_key(new_api_key)
+                    self.write_config(settings_to_save)
+                    error = None
+                except Exception as e:
+                    logging.error(f"Error while saving configuration: {e}")
+                    error = e
+                self.root.after(0, lambda: finish_save(error))
+
+            def finish_save(error):
+                settings_window.tk.call('tk', 'busy', 'forget', settings_window)
+                if error is not None:
+                    messagebox.showerror("Error", f"Failed to save configuration: {error}", parent=settings_window)
+                else:
+                    self.hide_modal(settings_window)
+
+            threading.Thread(target=write_settings, daemon=True).start()
 
         ttk.Button(settings_window, text="Save", command=save_settings).pack(pady=10)
 
+        self.settings_window = settings_window
+        self.refresh_settings_window = refresh_fields
+        refresh_fields()
+        settings_window.grab_set()  # Make the settings window modal
+
+    def show_modal(self, window):
+        """
+        Shows a previously hidden dialog window and makes it modal again.
+        """
+        window.deiconify()
+        window.lift()
+        window.grab_set()
+
+    def hide_modal(self, window):
+        """
+        Releases a dialog window's grab and hides it so it can be reopened without rebuilding.
+        """
+        window.grab_release()
+        window.withdraw()
+
     def initialize_global_hotkeys(self):
         """
         Initializes global hotkey listeners for Alt+R and Alt+C using pynput.
@@ -1618,22 +2418,8 @@ class AudioTranscriberApp:
             '<alt>+c': self.cancel_transcription_action
         }
 
-        # Define a listener class to handle hotkeys
-        class HotkeyListener(threading.Thread):
-            def __init__(self, hotkeys):
-                super().__init__()
-                self.hotkeys = hotkeys
-                self.listener = keyboard.GlobalHotKeys(self.hotkeys)
-                self.daemon = True
-
-            def run(self):
-                self.listener.start()
-
-            def stop(self):
-                self.listener.stop()
-
-        # Start the global hotkey listener
-        self.hotkey_listener = HotkeyListener(hotkeys)
+        # GlobalHotKeys is itself a daemon listener thread
+        self.hotkey_listener = keyboard.GlobalHotKeys(hotkeys)
         self.hotkey_listener.start()
 
     def run(self):
@@ -1664,16 +2450,47 @@ class AudioTranscriberApp:
     def open_help(self):
         """
         Opens the help window displaying the user guide.
+        The guide is read and formatted once; later opens show the same hidden window,
+        reloading the guide only if help_text.txt has been modified since.
         """
+        if self.help_window is not None:
+            self.load_help_text()
+            self.show_modal(self.help_window)
+            return
+
         help_window = tk.Toplevel(self.root)
         help_window.title("User Guide")
         help_window.geometry("800x500")  # Increased width from 600 to 800
+        help_window.protocol("WM_DELETE_WINDOW", lambda: self.hide_modal(help_window))
         help_window.grab_set()  # Make the help window modal
+        self.help_window = help_window
 
         help_text = scrolledtext.ScrolledText(help_window, wrap=tk.WORD, state='normal')
         help_text.pack(expand=True, fill="both")
+        self.help_text = help_text
+
+        # Configure tags for HTML-like formatting
+        help_text.tag_configure("h1", font=("Helvetica", 16, "bold"))
+        help_text.tag_configure("h2", font=("Helvetica", 14, "bold"))
+        help_text.tag_configure("h3", font=("Helvetica", 12, "bold"))
+        help_text.tag_configure("strong", font=("Helvetica", 10, "bold"))
+        help_text.tag_configure("em", font=("Helvetica", 10, "italic"))
 
+        self.load_help_text()
+
+    def load_help_text(self):
+        """
+        Fills the help window from help_text.txt, skipping the read and reformat
+        when the file's modification time matches the copy already shown.
+        """
         help_file_path = os.path.join(self.get_executable_dir(), 'help_text.txt')
+        try:
+            mtime = os.stat(help_file_path).st_mtime
+        except OSError:
+            mtime = None
+        if mtime is not None and mtime == self.help_mtime:
+            return
+
         try:
             with open(help_file_path, 'r', encoding='utf-8') as help_file:
                 help_content = help_file.read()
@@ -1681,51 +2498,22 @@ class AudioTranscriberApp:
             help_content = "Help file not found. Please check the application installation."
         except Exception as e:
             help_content = f"Error loading help content: {str(e)}"
-
-        # Configure tags for HTML-like formatting
-        help_text.tag_configure("h1", font=("Helvetica", 16, "bold"))
-        help_text.tag_configure("h2", font=("Helvetica", 14, "bold"))
-        help_text.tag_configure("h3", font=("Helvetica", 12, "bold"))
-        help_text.tag_configure("strong", font=("Helvetica", 10, "bold"))
-        help_text.tag_configure("em", font=("Helvetica", 10, "italic"))
+        self.help_mtime = mtime
 
         # Parse and insert formatted content
-        self.insert_formatted_text(help_text, help_content)
-        help_text.config(state='disabled')
+        self.help_text.config(state='normal')
+        self.help_text.delete("1.0", tk.END)
+        self.insert_formatted_text(self.help_text, help_content)
+        self.help_text.config(state='disabled')
 
     def insert_formatted_text(self, text_widget, content):
         """
         Parses the HTML-like tags and inserts formatted text into the text widget.
         """
-        tag_stack = []
-        i = 0
-        while i < len(content):
-            if content[i] == '<':
-                end = content.find('>', i)
-                if end != -1:
-                    tag = content[i+1:end]
-                    if tag.startswith('/'):
-                        if tag[1:] in tag_stack:
-                            tag_stack.remove(tag[1:])
-                    else:
-                        tag_stack.append(tag)
-                    i = end + 1
-
-                    # Handle special tags
-                    if tag in ['table', '/table', 'tr', '/tr', 'th', '/th', 'td', '/td']:
-                        text_widget.insert(tk.END, '\n')
-                    elif tag == 'li':
-                        text_widget.insert(tk.END, '• ')
-                    elif tag == '/li':
-                        text_widget.insert(tk.END, '\n')
-                    elif tag in ['summary', '/summary', 'details', '/details']:
-                        text_widget.insert(tk.END, '\n')
-
-                    continue
-
-            # Handle emoji and other special characters
-            text_widget.insert(tk.END, content[i], tuple(tag_stack))
-            i += 1
+        runs = self.parse_formatted_text(content)
+        if runs:
+            # Text.insert takes alternating text/tag-list arguments, so the whole guide is one call
+            text_widget.insert(tk.END, *(arg for run in runs for arg in run))
 
         # Configure additional tags
         text_widget.tag_configure("table", background="#f0f0f0", borderwidth=1, relief="solid")
@@ -1737,15 +2525,44 @@ class AudioTranscriberApp:
         text_widget.tag_bind("a", "<Enter>", lambda e: text_widget.config(cursor="hand2"))
         text_widget.tag_bind("a", "<Leave>", lambda e: text_widget.config(cursor=""))
 
+    def parse_formatted_text(self, content):
+        """
+        Splits HTML-like markup into (text, tags) runs, one per stretch of text sharing the same tags.
+        Block tags contribute untagged newline or bullet runs.
+        """
+        runs = []
+        tag_stack = []
+        tags = ()
+        text_start = 0
+        for match in FORMATTED_TAG_RE.finditer(content):
+            if match.start() > text_start:
+                runs.append((content[text_start:match.start()], tags))
+            text_start = match.end()
+
+            tag = match.group(1)
+            if tag.startswith('/'):
+                if tag[1:] in tag_stack:
+                    tag_stack.remove(tag[1:])
+            else:
+                tag_stack.append(tag)
+            tags = tuple(tag_stack)
+
+            block_text = FORMATTED_BLOCK_TEXT.get(tag)
+            if block_text:
+                runs.append((block_text, ()))
+        if text_start < len(content):
+            runs.append((content[text_start:], tags))
+        return runs
+
     def on_drop(self, event):
         """
         Handles the drag-and-drop event for audio files.
         """
         file_path = event.data
         file_path = file_path.strip("{}").strip('"')
-        _, file_extension = os.path.splitext(file_path.lower())
+        file_extension = os.path.splitext(file_path)[1].lower()
 
-        if file_extension in ('.wav', '.mp3', '.ogg', '.flac'):
+        if file_extension in AUDIO_EXTENSIONS:
             self.update_status(f"Transcribing dropped audio file: {os.path.basename(file_path)}...", "info")
             self.transcribe_audio_threaded(file_path)
         else:
@@ -1763,7 +2580,7 @@ class AudioTranscriberApp:
         if os.path.exists(sound_path):
             try:
                 pygame.mixer.music.load(sound_path)
-                pygame.mixer.music.set_volume(self.settings.get("volume", 1.0))
+                pygame.mixer.music.set_volume(self.volume)
                 pygame.mixer.music.play()
                 logging.info("Sound played successfully.")
             except pygame.error as e:
@@ -1773,24 +2590,42 @@ class AudioTranscriberApp:
 
     def update_volume(self, volume):
         """
-        Updates the volume for sound playback.
+        Updates the volume for sound playback. The volume slider calls this for every
+        step of a drag, so changes smaller than 1% are ignored unless they reach an end stop.
         """
+        if abs(volume - self.volume) < 0.01 and volume not in (0.0, 1.0):
+            return
+        self.volume = volume
         pygame.mixer.music.set_volume(volume)
         self.settings["volume"] = volume
 
     def initialize_tray_icon(self):
         """
-        Initializes the system tray icon using pystray.
+        Initializes the system tray icon using pystray on its own thread, so importing
+        pystray and PIL and drawing the icon stay off the startup path.
+        Does nothing when the tray_icon setting is turned off.
+        """
+        if not self.settings.get("tray_icon", True):
+            return
+        tray_thread = threading.Thread(target=self.run_tray_icon, daemon=True)
+        tray_thread.start()
+
+    def run_tray_icon(self):
+        """
+        Builds the tray icon and runs its event loop. Runs on the tray thread.
         """
+        import pystray
+
         image = self.create_image(64, 64, "black", "white")
         self.tray_icon = pystray.Icon("name", image, "Audio Transcriber", self.create_tray_menu())
-        tray_thread = threading.Thread(target=self.tray_icon.run, daemon=True)
-        tray_thread.start()
+        self.tray_icon.run()
 
     def create_tray_menu(self):
         """
         Creates the context menu for the system tray icon.
         """
+        import pystray
+
         return pystray.Menu(
             pystray.MenuItem("Open", self.on_tray_click),
             pystray.MenuItem("Exit", self.on_tray_exit)
@@ -1802,6 +2637,8 @@ class AudioTranscriberApp:
         """
         Creates an image for the system tray icon.
         """
+        from PIL import Image, ImageDraw
+
         image = Image.new('RGB', (width, height), color1)
         dc = ImageDraw.Draw(image)
         dc.rectangle([(width // 2, 0), (width, height)], fill=color2)
@@ -1811,9 +2648,15 @@ class AudioTranscriberApp:
         """
         Restores the application window when clicked from tray menu.
         """
-        self.root.after(0, lambda: self.root.deiconify())
-        self.root.after(0, lambda: self.root.lift())
-        self.root.after(0, lambda: self.root.focus_force())
+        self.root.after(0, self.restore_window)
+
+    def restore_window(self):
+        """
+        Shows, raises and focuses the main window.
+        """
+        self.root.deiconify()
+        self.root.lift()
+        self.root.focus_force()
 
     def on_tray_exit(self, icon, item):
         """
@@ -1822,14 +2665,15 @@ class AudioTranscriberApp:
         self.tray_icon.stop()
         self.on_closing()
 
-    def check_internet_connection(self, timeout=5):
+    def check_internet_connection(self, timeout=3):
         """
-        Checks if the application has an active internet connection.
+        Checks if the application has an active internet connection by opening a TCP
+        connection to the API host, without a TLS handshake or HTTP request.
         """
         try:
-            requests.get("https://www.google.com", timeout=timeout)
+            socket.create_connection(("api.openai.com", 443), timeout=timeout).close()
             return True
-        except requests.ConnectionError:
+        except OSError:
             return False
 
     def check_api_key(self):
@@ -1845,16 +2689,27 @@ class AudioTranscriberApp:
     def system_check(self):
         """
         Performs initial system checks to ensure all dependencies and requirements are met.
+        The network and device probes run on a worker thread so startup isn't blocked.
         """
-        checks = {
-            "Internet Connection": self.check_internet_connection(),
-            "Audio Devices": len(sd.query_devices()) > 0,
-            "API Key": bool(self.settings.get("api_key")),
-            "FFmpeg": shutil.which('ffmpeg') is not None
-        }
+        has_api_key = bool(self.settings.get("api_key"))
+
+        def run_checks():
+            checks = {
+                "Internet Connection": self.check_internet_connection(),
+                "Audio Devices": len(sd.query_devices()) > 0,
+                "API Key": has_api_key,
+                "FFmpeg": shutil.which('ffmpeg') is not None
+            }
+            failed_checks = [check for check, passed in checks.items() if not passed]
+            if failed_checks:
+                self.root.after(0, lambda: self.show_failed_checks(failed_checks))
 
-        failed_checks = [check for check, passed in checks.items() if not passed]
+        threading.Thread(target=run_checks, daemon=True).start()
 
+    def show_failed_checks(self, failed_checks):
+        """
+        Warns the user about system checks that did not pass.
+        """
         if failed_checks:
             message = "The following system checks failed:\n\n" + "\n".join(failed_checks)
             message += "\n\nSome features may not work correctly."